@@ -7,10 +7,11 @@ security measures and validation.
 """
 
 from fastapi import APIRouter, Request, Response, Depends, status, HTTPException
+from app.dependencies.repositories import get_user_repository
 from app.dto.auth_dto import AuthDto, AuthResponseDto
+from app.repository.user_repository import UserRepository
 from app.services.auth_service import AuthService
 
-
 # Authentication API router with prefix and tags
 router = APIRouter(
     prefix="/auth",
@@ -24,17 +25,22 @@ router = APIRouter(
 )
 
 
-def get_auth_service() -> AuthService:
+def get_auth_service(
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> AuthService:
     """
     Dependency injection for AuthService.
 
-    Creates and returns an AuthService instance for
-    handling authentication operations.
+    Creates and returns an AuthService instance with
+    an injected UserRepository dependency.
+
+    Args:
+        user_repository: User repository dependency
 
     Returns:
         AuthService: Configured authentication service instance
     """
-    return AuthService()
+    return AuthService(user_repository)
 
 
 @router.post(
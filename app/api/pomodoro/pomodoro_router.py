@@ -6,14 +6,14 @@ session management, round tracking, and time management operations
 with proper authentication and validation.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 
 from app.dependencies.auth import get_current_user
+from app.dependencies.repositories import get_pomodoro_repository
 from app.dto.pomodoro_dto import PomodoroRoundDto, PomodoroSessionDto
 from app.repository.pomodoro_repository import PomodoroRepository
 from app.services.pomodoro_service import PomodoroService
 
-
 # Pomodoro API router with prefix and tags
 router = APIRouter(
     prefix="/pomodoro",
@@ -26,17 +26,21 @@ router = APIRouter(
 )
 
 
-def get_pomodoro_service() -> PomodoroService:
+def get_pomodoro_service(
+    repository: PomodoroRepository = Depends(get_pomodoro_repository),
+) -> PomodoroService:
     """
     Dependency injection for PomodoroService.
 
     Creates and returns a PomodoroService instance with
-    a PomodoroRepository dependency.
+    an injected PomodoroRepository dependency.
+
+    Args:
+        repository: Pomodoro repository dependency
 
     Returns:
         PomodoroService: Configured pomodoro service instance
     """
-    repository = PomodoroRepository()
     return PomodoroService(repository)
 
 
@@ -190,6 +194,7 @@ async def update_pomodoro_session(
 )
 async def delete_pomodoro_session(
     session_id: str,
+    background_tasks: BackgroundTasks,
     service: PomodoroService = Depends(get_pomodoro_service),
     current_user: str = Depends(get_current_user),
 ) -> dict:
@@ -198,9 +203,11 @@ async def delete_pomodoro_session(
 
     Permanently deletes a pomodoro session belonging to
     the authenticated user. This action cannot be undone.
+    The deletion is committed right after the response is sent.
 
     Args:
         session_id: ID of the session to delete
+        background_tasks: Background tasks run after the response
         service: Pomodoro service dependency
         current_user: Current user ID from JWT token
 
@@ -208,8 +215,8 @@ async def delete_pomodoro_session(
         dict: Confirmation of deletion with session ID
     """
     try:
-        deleted_session_id = await service.delete_pomodoro_session(
-            current_user, session_id
+        deleted_session_id = service.schedule_delete_pomodoro_session(
+            background_tasks, current_user, session_id
         )
         return {
             "id": deleted_session_id,
@@ -6,14 +6,23 @@ CRUD operations for task management with proper authentication,
 validation, and error handling.
 """
 
-from typing import Annotated
-from fastapi import APIRouter, Depends, status, HTTPException
+from typing import Annotated, AsyncIterator
+import msgspec
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, status, HTTPException
+from fastapi.responses import StreamingResponse
 
+from app.core.responses import MsgspecJSONResponse
 from app.dto.task_dto import *
 from app.repository.task_repository import TaskRepository
 from app.services.task_service import TaskService
 from app.dependencies.auth import get_current_user
+from app.dependencies.repositories import get_task_repository
 
+# Maximum number of tasks accepted by one bulk import
+MAX_BULK_TASKS = 1000
+
+# Bytes buffered before a streamed task list chunk is sent
+STREAM_CHUNK_SIZE = 64 * 1024
 
 # Task API router with prefix and tags
 router = APIRouter(
@@ -27,17 +36,21 @@ router = APIRouter(
 )
 
 
-def get_task_service() -> TaskService:
+def get_task_service(
+    repository: TaskRepository = Depends(get_task_repository),
+) -> TaskService:
     """
     Dependency injection for TaskService.
 
     Creates and returns a TaskService instance with
-    a TaskRepository dependency.
+    an injected TaskRepository dependency.
+
+    Args:
+        repository: Task repository dependency
 
     Returns:
         TaskService: Configured task service instance
     """
-    repository = TaskRepository()
     return TaskService(repository)
 
 
@@ -56,7 +69,8 @@ async def get_tasks(
     Get all tasks for the current user.
 
     Retrieves all tasks belonging to the authenticated user
-    with their complete information and status.
+    with their complete information and status. The task list is
+    embedded as already encoded JSON, skipping response model validation.
 
     Args:
         service: Task service dependency
@@ -69,8 +83,8 @@ async def get_tasks(
         HTTPException: If retrieval fails or user unauthorized
     """
     try:
-        tasks = await service.get_all(current_user)
-        return ListTaskResponseDto.model_validate(tasks)
+        tasks = await service.get_all_json(current_user)
+        return MsgspecJSONResponse({"ok": True, "tasks": msgspec.Raw(tasks)})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -78,6 +92,65 @@ async def get_tasks(
         )
 
 
+async def encode_tasks_stream(tasks: AsyncIterator[TaskStruct]) -> AsyncIterator[bytes]:
+    """
+    Encode streamed tasks as a task list response body.
+
+    Writes the same JSON document as ListTaskResponseDto one row at
+    a time, sending it in chunks of about STREAM_CHUNK_SIZE bytes.
+
+    Args:
+        tasks: Async iterator of task structs
+
+    Yields:
+        Chunks of the JSON response body
+    """
+    encoder = msgspec.json.Encoder()
+    buffer = bytearray(b'{"ok":true,"tasks":[')
+    first = True
+    async for task in tasks:
+        if not first:
+            buffer += b","
+        first = False
+        encoder.encode_into(task, buffer, -1)
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
+@router.get(
+    "/stream",
+    response_model=ListTaskResponseDto,
+    status_code=status.HTTP_200_OK,
+    summary="Stream all tasks",
+    description="Stream all tasks for the authenticated user",
+)
+async def stream_tasks(
+    service: TaskService = Depends(get_task_service),
+    current_user: str = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Stream all tasks for the current user.
+
+    Returns the same document as GET /tasks, but rows are encoded
+    while they are fetched from the database, so memory stays
+    bounded for users with many tasks.
+
+    Args:
+        service: Task service dependency
+        current_user: Current user ID from JWT token
+
+    Returns:
+        StreamingResponse: JSON list of user's tasks
+    """
+    return StreamingResponse(
+        encode_tasks_stream(service.iter_all(current_user)),
+        media_type="application/json",
+    )
+
+
 @router.post(
     "",
     response_model=TaskResponseDto,
@@ -94,7 +167,8 @@ async def create_task(
     Create a new task.
 
     Creates a new task for the authenticated user with
-    the provided task information and preferences.
+    the provided task information and preferences. The validated
+    task is encoded directly, skipping response model validation.
 
     Args:
         task_data: Task creation data transfer object
@@ -109,7 +183,10 @@ async def create_task(
     """
     try:
         task: TaskDto = await service.create(current_user, task_data)
-        return TaskResponseDto.model_validate(task)
+        return MsgspecJSONResponse(
+            {"ok": True, "task": task.model_dump(mode="json", by_alias=True)},
+            status_code=status.HTTP_201_CREATED,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -117,6 +194,48 @@ async def create_task(
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkCreateTaskResponseDto,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import tasks",
+    description="Create several tasks for the authenticated user at once",
+)
+async def create_tasks_bulk(
+    tasks_data: Annotated[list[CreateTaskDto], Body(max_length=MAX_BULK_TASKS)],
+    service: TaskService = Depends(get_task_service),
+    current_user: str = Depends(get_current_user),
+) -> BulkCreateTaskResponseDto:
+    """
+    Create several tasks at once.
+
+    Inserts all tasks for the authenticated user in a single
+    statement and transaction, so either every task is created
+    or none is.
+
+    Args:
+        tasks_data: Task creation data for every task
+        service: Task service dependency
+        current_user: Current user ID from JWT token
+
+    Returns:
+        BulkCreateTaskResponseDto: IDs of the created tasks
+
+    Raises:
+        HTTPException: If task creation fails or validation error
+    """
+    try:
+        ids = await service.create_many(current_user, tasks_data)
+        return MsgspecJSONResponse(
+            {"ok": True, "ids": ids}, status_code=status.HTTP_201_CREATED
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create tasks",
+        )
+
+
 @router.put(
     "/{id}",
     response_model=TaskResponseDto,
@@ -135,7 +254,8 @@ async def update_task(
 
     Updates a task belonging to the authenticated user
     with the provided task information. All fields are optional
-    for partial updates.
+    for partial updates. The validated task is encoded directly,
+    skipping response model validation.
 
     Args:
         id: Task ID to update
@@ -151,7 +271,9 @@ async def update_task(
     """
     try:
         task: TaskDto = await service.update(current_user, id, task_data)
-        return TaskResponseDto.model_validate(task)
+        return MsgspecJSONResponse(
+            {"ok": True, "task": task.model_dump(mode="json", by_alias=True)}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -168,6 +290,7 @@ async def update_task(
 )
 async def delete_task(
     id: str,
+    background_tasks: BackgroundTasks,
     service: TaskService = Depends(get_task_service),
     current_user: str = Depends(get_current_user),
 ) -> DeleteTaskResponseDto:
@@ -175,10 +298,12 @@ async def delete_task(
     Delete a task.
 
     Permanently deletes a task belonging to the authenticated user.
-    This action cannot be undone.
+    This action cannot be undone. The deletion is committed right
+    after the response is sent.
 
     Args:
         id: Task ID to delete
+        background_tasks: Background tasks run after the response
         service: Task service dependency
         current_user: Current user ID from JWT token
 
@@ -189,8 +314,8 @@ async def delete_task(
         HTTPException: If task not found, deletion fails, or unauthorized
     """
     try:
-        await service.delete(current_user, id)
-        return DeleteTaskResponseDto.model_validate({"id": id})
+        service.schedule_delete(background_tasks, current_user, id)
+        return MsgspecJSONResponse({"ok": True, "id": id})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -6,13 +6,17 @@ profile management, user preferences, and account operations
 with proper authentication and validation.
 """
 
+import logging
 from fastapi import APIRouter, Depends, status, HTTPException
 
 from app.dependencies.auth import get_current_user
+from app.dependencies.repositories import get_user_repository
 from app.dto.user_dto import GetUserDto, ResponseUserDto, UpdateUserDto
 from app.repository.user_repository import UserRepository
 from app.services.user_service import UserService
 
+# Setup logging
+logger = logging.getLogger(__name__)
 
 # User API router with prefix and tags
 router = APIRouter(
@@ -26,17 +30,21 @@ router = APIRouter(
 )
 
 
-def get_user_service() -> UserService:
+def get_user_service(
+    repository: UserRepository = Depends(get_user_repository),
+) -> UserService:
     """
     Dependency injection for UserService.
 
     Creates and returns a UserService instance with
-    a UserRepository dependency.
+    an injected UserRepository dependency.
+
+    Args:
+        repository: User repository dependency
 
     Returns:
         UserService: Configured user service instance
     """
-    repository = UserRepository()
     return UserService(repository)
 
 
@@ -72,7 +80,7 @@ async def get_me(
         user = await service.get_me(user_id)
         return user
     except Exception as e:
-        print(e)
+        logger.error(f"Failed to retrieve user profile: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user profile",
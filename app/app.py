@@ -6,11 +6,14 @@ components including routers, middleware, database setup, and
 lifespan management.
 """
 
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from app.api.routers import get_api_router
 from app.core.database import create_tables
+from app.core.responses import MsgspecJSONResponse
+from app.dependencies.repositories import get_task_repository
 from app.middlewares.rate_limiter import RateLimiterMiddleware
 
 
@@ -25,8 +28,16 @@ async def lifespan(app: FastAPI):
     Args:
         app: FastAPI application instance
     """
+    # Startup: Run tasks eagerly so coroutines that finish without
+    # suspending never get scheduled on the event loop (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Startup: Create database tables
     await create_tables()
+
+    # Startup: Compile hot statements before the first request
+    await get_task_repository().warm_up()
     yield
     # Shutdown: Cleanup operations (if needed)
     # await cleanup_resources()
@@ -41,6 +52,7 @@ app = FastAPI(
     description="A comprehensive API for managing tasks and pomodoro sessions",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=MsgspecJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
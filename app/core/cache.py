@@ -0,0 +1,35 @@
+"""
+Cache configuration module.
+
+This module provides the shared Redis client used by repositories
+to cache data across all application workers, and short-lived
+in-process caches for data that is read far more often than it changes.
+"""
+
+from datetime import datetime
+from typing import Tuple
+
+import redis.asyncio as redis
+from cachetools import TTLCache
+
+from app.core.configs import REDIS_URL
+
+# Redis client shared by repository caches
+redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+
+# Task change counter by user ID, bumped on every task change. Readers note
+# it before querying and only fill the caches below if it did not move, so a
+# query that overlapped a write never stores its pre-write result. Counters
+# only need to outlive a read, the TTL keeps them far above the cache TTLs
+# and any query while bounding memory to recently changed users.
+tasks_generation: TTLCache[str, int] = TTLCache(maxsize=100_000, ttl=300)
+
+# Task statistics by user ID, stored with the day start they were counted for.
+# Entries are dropped on task changes; the TTL bounds staleness across workers.
+tasks_statistic_cache: TTLCache[str, Tuple[datetime, Tuple[int, int, int, int]]] = (
+    TTLCache(maxsize=10_000, ttl=5)
+)
+
+# Encoded JSON task lists by user ID, dropped on task changes like the
+# statistics above and expired by TTL for changes made on other workers
+tasks_list_cache: TTLCache[str, bytes] = TTLCache(maxsize=10_000, ttl=5)
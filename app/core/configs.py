@@ -45,6 +45,17 @@ def _load_security_config() -> Dict[str, Any]:
         raise ValueError("DATABASE_URL environment variable is required")
     config["database_url"] = database_url
 
+    # Database connection pool
+    try:
+        config["db_pool_size"] = int(Config.get_env("DB_POOL_SIZE") or "20")
+        config["db_max_overflow"] = int(Config.get_env("DB_MAX_OVERFLOW") or "30")
+        config["db_pool_recycle"] = int(Config.get_env("DB_POOL_RECYCLE") or "1800")
+        config["db_statement_cache_size"] = int(
+            Config.get_env("DB_STATEMENT_CACHE_SIZE") or "1024"
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid database pool configuration: {e}")
+
     # Redis URL
     redis_url = Config.get_env("REDIS_URL")
     if not redis_url:
@@ -86,6 +97,10 @@ try:
         SECURITY_CONFIG["refresh_token_expire_days"] * 24 * 60
     )
     DATABASE_URL: str = SECURITY_CONFIG["database_url"]
+    DB_POOL_SIZE: int = SECURITY_CONFIG["db_pool_size"]
+    DB_MAX_OVERFLOW: int = SECURITY_CONFIG["db_max_overflow"]
+    DB_POOL_RECYCLE: int = SECURITY_CONFIG["db_pool_recycle"]
+    DB_STATEMENT_CACHE_SIZE: int = SECURITY_CONFIG["db_statement_cache_size"]
     REDIS_URL: str = SECURITY_CONFIG["redis_url"]
     ANTI_DDOS_RATE_LIMIT: int = SECURITY_CONFIG["anti_ddos_rate_limit"]
     ANTI_DDOS_RATE_WINDOW: int = SECURITY_CONFIG["anti_ddos_rate_window"]
@@ -9,24 +9,54 @@ users, tasks, pomodoro sessions, and time blocks.
 from datetime import datetime
 from uuid import uuid4
 from sqlalchemy import String, DateTime, ForeignKey, Index, CheckConstraint
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from app.core.configs import DATABASE_URL
+from app.core.configs import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_STATEMENT_CACHE_SIZE,
+    DEBUG,
+)
+
+# Connection pool sizing, SQLite engines manage their own pool
+pool_options = (
+    {}
+    if DATABASE_URL.startswith("sqlite")
+    else {
+        "pool_size": DB_POOL_SIZE,  # Connection pool size
+        "max_overflow": DB_MAX_OVERFLOW,  # Maximum overflow connections
+        "pool_recycle": DB_POOL_RECYCLE,  # Recycle connections (seconds)
+    }
+)
+
+# Prepared statement caches per connection, asyncpg only: statement_cache_size
+# is asyncpg's own cache, prepared_statement_cache_size is SQLAlchemy's
+connect_args = (
+    {
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+    }
+    if DATABASE_URL.startswith("postgresql+asyncpg")
+    else {}
+)
 
 # Database engine configuration with improved settings
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,  # Log SQL queries for debugging
+    echo=DEBUG,  # Log SQL queries in debug mode only
     pool_pre_ping=True,  # Validate connections before use
-    pool_size=10,  # Connection pool size
-    max_overflow=20,  # Maximum overflow connections
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    connect_args=connect_args,
+    **pool_options,
 )
 
 # Session factory for database operations
 new_session = async_sessionmaker(
     engine,
+    class_=AsyncSession,
     expire_on_commit=False,
+    autoflush=False,  # No query reads back pending objects; commit() flushes
 )
 
 
@@ -0,0 +1,35 @@
+"""
+Response classes module.
+
+This module provides the JSON response class used as the application
+default, encoding content with msgspec instead of the standard library.
+"""
+
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+# Encoder shared by every response, so it is not rebuilt on each render
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response encoded with msgspec.
+
+    Accepts everything JSONResponse does, plus msgspec structs,
+    which are written straight to bytes without building dicts.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Encode response content to JSON bytes.
+
+        Args:
+            content: Data to encode
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return _encoder.encode(content)
@@ -1,9 +1,11 @@
 import bcrypt
 import logging
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from app.core.configs import (
     JWT_SECRET_KEY,
@@ -18,6 +20,13 @@ logger = logging.getLogger(__name__)
 # Constants
 ACCESS_TOKEN_COOKIE_NAME: str = "access_token"
 REFRESH_TOKEN_COOKIE_NAME: str = "refresh_token"
+ARGON2_HASH_PREFIX: str = "$argon2"
+
+# Signing key is parsed once instead of on every encode/decode
+jwt_key = jwk.construct(JWT_SECRET_KEY, ALGORITHM)
+
+# Argon2id hasher shared by hash_password and verify_password
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
 
 
 def create_token(data: Dict[str, Any], _timedelta: timedelta) -> str:
@@ -38,7 +47,7 @@ def create_token(data: Dict[str, Any], _timedelta: timedelta) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + _timedelta
         to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=ALGORITHM)
+        return jwt.encode(to_encode, jwt_key, algorithm=ALGORITHM)
     except Exception as e:
         logger.error(f"Failed to create token: {e}")
         raise
@@ -72,6 +81,19 @@ def create_refresh_token(user_id: str) -> str:
     )
 
 
+def create_tokens(user_id: str) -> Tuple[str, str]:
+    """
+    Creates access and refresh tokens for user
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Tuple of (access_token, refresh_token)
+    """
+    return create_access_token(user_id), create_refresh_token(user_id)
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decodes JWT token
@@ -83,7 +105,7 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
         Decoded token data or None on error
     """
     try:
-        return jwt.decode(token, JWT_SECRET_KEY, algorithms=[ALGORITHM])
+        return jwt.decode(token, jwt_key, algorithms=[ALGORITHM])
     except JWTError as e:
         logger.warning(f"Failed to decode token: {e}")
         return None
@@ -94,7 +116,7 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
 
 def hash_password(password: str) -> str:
     """
-    Hashes password using bcrypt
+    Hashes password using argon2id
 
     Args:
         password: Password to hash
@@ -109,10 +131,7 @@ def hash_password(password: str) -> str:
         raise ValueError("Password cannot be empty")
 
     try:
-        password_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt()
-        hashed_bytes = bcrypt.hashpw(password_bytes, salt)
-        return hashed_bytes.decode("utf-8")
+        return password_hasher.hash(password)
     except Exception as e:
         logger.error(f"Failed to hash password: {e}")
         raise
@@ -122,6 +141,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies password against its hash
 
+    Hashes created before the switch to argon2id are still
+    verified with bcrypt.
+
     Args:
         plain_password: Password in plain text
         hashed_password: Hashed password
@@ -133,9 +155,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
     try:
+        if hashed_password.startswith(ARGON2_HASH_PREFIX):
+            return password_hasher.verify(hashed_password, plain_password)
+
         password_bytes = plain_password.encode("utf-8")
         hashed_bytes = hashed_password.encode("utf-8")
         return bcrypt.checkpw(password_bytes, hashed_bytes)
+    except (VerificationError, InvalidHashError):
+        return False
     except Exception as e:
         logger.error(f"Failed to verify password: {e}")
         return False
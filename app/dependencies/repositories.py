@@ -0,0 +1,56 @@
+"""
+Repository dependencies module.
+
+This module provides FastAPI dependencies for injecting repository
+instances into services and route handlers. Repositories open their
+own sessions from the application's session factory and hold no
+request state, so each provider builds a single shared instance.
+"""
+
+from functools import lru_cache
+
+from app.repository.pomodoro_repository import PomodoroRepository
+from app.repository.task_repository import TaskRepository
+from app.repository.user_repository import UserRepository
+
+
+@lru_cache(maxsize=None)
+def get_user_repository() -> UserRepository:
+    """
+    Get repository for user operations.
+
+    Returns:
+        UserRepository: Shared user repository instance
+
+    Example:
+        ```python
+        @app.get("/users/{id}")
+        async def get_user(
+            id: str, repository: UserRepository = Depends(get_user_repository)
+        ):
+            return await repository.find_by_id(id)
+        ```
+    """
+    return UserRepository()
+
+
+@lru_cache(maxsize=None)
+def get_task_repository() -> TaskRepository:
+    """
+    Get repository for task operations.
+
+    Returns:
+        TaskRepository: Shared task repository instance
+    """
+    return TaskRepository()
+
+
+@lru_cache(maxsize=None)
+def get_pomodoro_repository() -> PomodoroRepository:
+    """
+    Get repository for pomodoro operations.
+
+    Returns:
+        PomodoroRepository: Shared pomodoro repository instance
+    """
+    return PomodoroRepository()
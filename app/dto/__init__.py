@@ -14,9 +14,11 @@ from .task_dto import (
     Priority,
     CreateTaskDto,
     TaskDto,
+    TaskStruct,
     UpdateTaskDto,
     ListTaskResponseDto,
     TaskResponseDto,
+    BulkCreateTaskResponseDto,
     DeleteTaskResponseDto,
 )
 
@@ -54,9 +56,11 @@ __all__ = [
     "Priority",
     "CreateTaskDto",
     "TaskDto",
+    "TaskStruct",
     "UpdateTaskDto",
     "ListTaskResponseDto",
     "TaskResponseDto",
+    "BulkCreateTaskResponseDto",
     "DeleteTaskResponseDto",
     # User
     "UserDto",
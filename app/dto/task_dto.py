@@ -5,6 +5,7 @@ This module provides DTOs for task-related operations including
 creation, updates, responses, and data validation for task management.
 """
 
+import msgspec
 from pydantic import BaseModel
 from enum import Enum
 
@@ -50,6 +51,27 @@ class TaskDto(CreateTaskDto, BaseDto):
     user_id: str
 
 
+class TaskStruct(msgspec.Struct, rename="camel", gc=False):
+    """
+    Read-only task mirror of TaskDto for list responses.
+
+    Built from trusted database rows and encoded by msgspec
+    with the same camelCase keys as TaskDto. Timestamps hold
+    isoformat() strings, matching the json_encoders of the DTOs.
+    Fields hold only scalars, so instances are kept out of the
+    garbage collector.
+    """
+
+    id: str
+    created_at: str
+    updated_at: str
+    title: str
+    description: str | None
+    priority: str | None
+    is_completed: bool
+    user_id: str
+
+
 class ListTaskResponseDto(ResponseDto):
     """
     Response DTO for task list operations.
@@ -70,6 +92,17 @@ class TaskResponseDto(ResponseDto):
     task: TaskDto
 
 
+class BulkCreateTaskResponseDto(ResponseDto):
+    """
+    Response DTO for bulk task creation.
+
+    Contains the IDs of the created tasks, in request order,
+    with success status.
+    """
+
+    ids: list[str]
+
+
 class UpdateTaskDto(CreateTaskDto):
     """
     DTO for updating existing tasks.
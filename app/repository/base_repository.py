@@ -6,7 +6,8 @@ for all repository classes in the application, providing common database
 session management and basic CRUD operations.
 """
 
-from typing import TypeVar
+from typing import Any, Dict, Type, TypeVar
+from pydantic import BaseModel as BaseDtoModel
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.core.database import new_session, BaseModel
 
@@ -34,3 +35,23 @@ class BaseRepository:
                     Defaults to the application's session maker.
         """
         self.session = session
+
+    def _column_values(
+        self, orm_class: Type[TypeOrm], data: BaseDtoModel
+    ) -> Dict[str, Any]:
+        """
+        Get explicitly set DTO fields that map to columns of an ORM model.
+
+        Args:
+            orm_class: ORM model class being updated
+            data: DTO with the new values
+
+        Returns:
+            Column values ready to be passed to an UPDATE statement
+        """
+        columns = orm_class.__table__.columns.keys()
+        return {
+            key: value
+            for key, value in data.model_dump(exclude_unset=True).items()
+            if key in columns
+        }
@@ -7,12 +7,11 @@ round management, and pomodoro timer functionality.
 """
 
 from datetime import datetime, time
-from sqlalchemy import delete, select, and_
+from sqlalchemy import Select, delete, select, update, and_
 from sqlalchemy.orm import selectinload
-from app.core.database import PomodoroRoundOrm, PomodoroSessionOrm
+from app.core.database import PomodoroRoundOrm, PomodoroSessionOrm, UserOrm
 from app.dto.pomodoro_dto import PomodoroRoundDto, PomodoroSessionDto
 from app.repository.base_repository import BaseRepository
-from app.repository.user_repository import UserRepository
 
 
 class PomodoroRepository(BaseRepository):
@@ -23,7 +22,29 @@ class PomodoroRepository(BaseRepository):
     handling pomodoro rounds, and tracking pomodoro timer functionality.
     """
 
-    user_repository = UserRepository()
+    @staticmethod
+    def _today_session_query(user_id: str) -> Select:
+        """
+        Build the query for today's pomodoro session of a user.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Select statement loading the session with its rounds
+        """
+        return (
+            select(PomodoroSessionOrm)
+            .options(selectinload(PomodoroSessionOrm.rounds))
+            .order_by(PomodoroSessionOrm.id.asc())
+            .where(
+                and_(
+                    PomodoroSessionOrm.user_id == user_id,
+                    PomodoroSessionOrm.created_at
+                    >= datetime.combine(datetime.today().date(), time.min),
+                )
+            )
+        )
 
     async def get_today_session(self, user_id: str) -> PomodoroSessionOrm | None:
         """
@@ -36,19 +57,7 @@ class PomodoroRepository(BaseRepository):
             Today's pomodoro session if exists, None otherwise
         """
         async with self.session() as session:
-            query = (
-                select(PomodoroSessionOrm)
-                .options(selectinload(PomodoroSessionOrm.rounds))
-                .order_by(PomodoroSessionOrm.id.asc())
-                .where(
-                    and_(
-                        PomodoroSessionOrm.user_id == user_id,
-                        PomodoroSessionOrm.created_at
-                        >= datetime.combine(datetime.today().date(), time.min),
-                    )
-                )
-            )
-            result = await session.execute(query)
+            result = await session.execute(self._today_session_query(user_id))
             pomodoro_session = result.scalars().first()
             return pomodoro_session
 
@@ -60,6 +69,10 @@ class PomodoroRepository(BaseRepository):
         Otherwise, creates a new session with the appropriate number of rounds
         based on the user's interval count settings.
 
+        The session lookup, the user lookup and the insert share one
+        database session, so a call never holds more than one pooled
+        connection.
+
         Args:
             user_id: ID of the user
 
@@ -69,27 +82,25 @@ class PomodoroRepository(BaseRepository):
         Raises:
             ValueError: If user is not found
         """
-        today_session = await self.get_today_session(user_id)
-        if today_session:
-            return today_session
-
         async with self.session() as session:
-            user = await self.user_repository.find_by_id(user_id)
+            result = await session.execute(self._today_session_query(user_id))
+            today_session = result.scalars().first()
+            if today_session:
+                return today_session
+
+            user = await session.get(UserOrm, user_id)
             if not user:
                 raise ValueError("User not found")
-            pomodoro_session = PomodoroSessionOrm(user_id=user_id)
-            session.add(pomodoro_session)
-
-            await session.flush()
 
+            # Rounds get their session id from the relationship when the
+            # commit flushes the session row first
             interval_count = user.interval_count or 7  # default value
-            for i in range(interval_count):
-                pomodoro_session.rounds.append(
-                    PomodoroRoundOrm(pomodoro_session_id=pomodoro_session.id)
-                )
-            await session.flush()
+            pomodoro_session = PomodoroSessionOrm(
+                user_id=user_id,
+                rounds=[PomodoroRoundOrm() for _ in range(interval_count)],
+            )
+            session.add(pomodoro_session)
             await session.commit()
-            await session.refresh(pomodoro_session)
 
             return pomodoro_session
 
@@ -111,25 +122,24 @@ class PomodoroRepository(BaseRepository):
             ValueError: If session with the specified ID is not found
         """
         async with self.session() as session:
-            query = select(PomodoroSessionOrm).where(
-                and_(
-                    PomodoroSessionOrm.id == session_id,
-                    PomodoroSessionOrm.user_id == user_id,
+            query = (
+                update(PomodoroSessionOrm)
+                .where(
+                    and_(
+                        PomodoroSessionOrm.id == session_id,
+                        PomodoroSessionOrm.user_id == user_id,
+                    )
                 )
+                .values(**self._column_values(PomodoroSessionOrm, data))
+                .returning(PomodoroSessionOrm)
             )
             result = await session.execute(query)
-            pomodoro_session = result.scalars().first()
+            pomodoro_session = result.scalar_one_or_none()
 
             if not pomodoro_session:
                 raise ValueError(f"Pomodoro session with id {session_id} not found")
 
-            update_data = data.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(pomodoro_session, key, value)
-
-            await session.flush()
             await session.commit()
-            await session.refresh(pomodoro_session)
             return pomodoro_session
 
     async def update_round(
@@ -149,20 +159,19 @@ class PomodoroRepository(BaseRepository):
             ValueError: If round with the specified ID is not found
         """
         async with self.session() as session:
-            query = select(PomodoroRoundOrm).where(PomodoroRoundOrm.id == round_id)
+            query = (
+                update(PomodoroRoundOrm)
+                .where(PomodoroRoundOrm.id == round_id)
+                .values(**self._column_values(PomodoroRoundOrm, data))
+                .returning(PomodoroRoundOrm)
+            )
             result = await session.execute(query)
-            pomodoro_round = result.scalars().first()
+            pomodoro_round = result.scalar_one_or_none()
 
             if not pomodoro_round:
                 raise ValueError(f"Pomodoro round with id {round_id} not found")
 
-            update_data = data.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(pomodoro_round, key, value)
-
-            await session.flush()
             await session.commit()
-            await session.refresh(pomodoro_round)
             return pomodoro_round
 
     async def delete_round(self, user_id: str, session_id: str, round_id: str) -> None:
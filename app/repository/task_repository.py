@@ -5,14 +5,52 @@ This module contains the TaskRepository class which handles all database
 operations related to tasks, including CRUD operations and task management.
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
-from sqlalchemy import and_, select, delete
+import msgspec
+from sqlalchemy import Row, and_, bindparam, delete, insert, select
 from sqlalchemy.exc import SQLAlchemyError
+from app.core.cache import tasks_generation, tasks_list_cache, tasks_statistic_cache
 from app.core.database import TaskOrm
-from app.dto.task_dto import CreateTaskDto, UpdateTaskDto
+from app.dto.task_dto import CreateTaskDto, TaskStruct, UpdateTaskDto
 from app.repository.base_repository import BaseRepository
 
+# Rows fetched per round trip when streaming tasks
+STREAM_BATCH_SIZE = 500
+
+# Columns read for task lists, in TaskStruct field order
+_TASK_COLUMNS = (
+    TaskOrm.id,
+    TaskOrm.created_at,
+    TaskOrm.updated_at,
+    TaskOrm.title,
+    TaskOrm.description,
+    TaskOrm.priority,
+    TaskOrm.is_completed,
+    TaskOrm.user_id,
+)
+
+# Task list statements, built once and reused with a bound user_id
+_GET_ALL_STMT = select(*_TASK_COLUMNS).where(TaskOrm.user_id == bindparam("user_id"))
+_ITER_ALL_STMT = _GET_ALL_STMT.execution_options(yield_per=STREAM_BATCH_SIZE)
+
+
+def _to_struct(row: Row) -> TaskStruct:
+    """
+    Convert a task list row to TaskStruct.
+
+    Timestamps are formatted with isoformat() like the pydantic DTOs,
+    msgspec would otherwise write UTC offsets as "Z".
+
+    Args:
+        row: Row of _TASK_COLUMNS values
+
+    Returns:
+        Task struct instance
+    """
+    id, created_at, updated_at, *fields = row
+    return TaskStruct(id, created_at.isoformat(), updated_at.isoformat(), *fields)
+
 
 class TaskRepository(BaseRepository):
     """
@@ -22,6 +60,33 @@ class TaskRepository(BaseRepository):
     tasks, as well as managing task relationships with users.
     """
 
+    @staticmethod
+    def _invalidate_cached(user_id: str) -> None:
+        """
+        Drop cached task data of a user after their tasks changed.
+
+        Bumps the user's task generation first, so reads that were
+        already running when the change committed do not cache
+        their stale results.
+
+        Args:
+            user_id: ID of the user whose tasks changed
+        """
+        tasks_generation[user_id] = tasks_generation.get(user_id, 0) + 1
+        tasks_statistic_cache.pop(user_id, None)
+        tasks_list_cache.pop(user_id, None)
+
+    async def warm_up(self) -> None:
+        """
+        Compile the task list statement ahead of the first request.
+
+        Runs the list query for a user ID that cannot exist, which
+        stores its compiled SQL in the engine's cache and opens the
+        first pooled connection without reading any rows.
+        """
+        async with self.session() as session:
+            await session.execute(_GET_ALL_STMT, {"user_id": ""})
+
     async def create(self, user_id: str, data: CreateTaskDto) -> TaskOrm:
         """
         Create a new task for a user.
@@ -37,19 +102,50 @@ class TaskRepository(BaseRepository):
             SQLAlchemyError: If database operation fails
         """
         async with self.session() as session:
-            task_dict = data.model_dump()
-            task_dict["user_id"] = user_id
+            # CreateTaskDto is flat and stores enums as values, so its
+            # __dict__ already holds the column values
+            query = (
+                insert(TaskOrm)
+                .values(**data.__dict__, user_id=user_id)
+                .returning(TaskOrm)
+            )
+            result = await session.execute(query)
+            task = result.scalar_one()
+            await session.commit()
 
-            task = TaskOrm(**task_dict)
-            session.add(task)
+            self._invalidate_cached(user_id)
+            return task
+
+    async def create_many(self, user_id: str, items: List[CreateTaskDto]) -> List[str]:
+        """
+        Create several tasks for a user in a single statement.
+
+        Args:
+            user_id: ID of the user who owns the tasks
+            items: Task creation data for every task
+
+        Returns:
+            IDs of the created tasks, in input order
 
-            await session.flush()
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not items:
+            return []
+
+        async with self.session() as session:
+            rows = [{**item.__dict__, "user_id": user_id} for item in items]
+            result = await session.execute(
+                insert(TaskOrm).returning(TaskOrm.id, sort_by_parameter_order=True),
+                rows,
+            )
+            ids = list(result.scalars())
             await session.commit()
-            await session.refresh(task)
 
-            return task
+            self._invalidate_cached(user_id)
+            return ids
 
-    async def get_all(self, user_id: str) -> List[TaskOrm]:
+    async def get_all(self, user_id: str) -> List[TaskStruct]:
         """
         Get all tasks for a specific user.
 
@@ -57,13 +153,56 @@ class TaskRepository(BaseRepository):
             user_id: ID of the user whose tasks to retrieve
 
         Returns:
-            List of task objects belonging to the user
+            List of task structs belonging to the user
         """
         async with self.session() as session:
-            query = select(TaskOrm).where(TaskOrm.user_id == user_id)
-            result = await session.execute(query)
-            tasks_models = list(result.scalars().all())
-            return tasks_models
+            result = await session.execute(_GET_ALL_STMT, {"user_id": user_id})
+            return [_to_struct(row) for row in result]
+
+    async def get_all_json(self, user_id: str) -> bytes:
+        """
+        Get all tasks for a specific user as an encoded JSON array.
+
+        Served from the in-process task list cache when possible,
+        otherwise loaded with get_all and cached, unless the user's
+        tasks changed while loading.
+
+        Args:
+            user_id: ID of the user whose tasks to retrieve
+
+        Returns:
+            JSON array of the user's tasks
+        """
+        cached = tasks_list_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        generation = tasks_generation.get(user_id, 0)
+        encoded = msgspec.json.encode(await self.get_all(user_id))
+        if tasks_generation.get(user_id, 0) == generation:
+            tasks_list_cache[user_id] = encoded
+        return encoded
+
+    async def iter_all(self, user_id: str) -> AsyncIterator[TaskStruct]:
+        """
+        Stream all tasks for a specific user.
+
+        Rows are fetched in batches of STREAM_BATCH_SIZE through a
+        server-side cursor, so memory stays bounded however many tasks
+        the user has. The session stays open until the iterator is
+        exhausted or closed.
+
+        Args:
+            user_id: ID of the user whose tasks to retrieve
+
+        Yields:
+            Task structs belonging to the user
+        """
+        async with self.session() as session:
+            result = await session.stream(_ITER_ALL_STMT, {"user_id": user_id})
+            async for partition in result.partitions():
+                for row in partition:
+                    yield _to_struct(row)
 
     async def update(self, user_id: str, id: str, data: UpdateTaskDto) -> TaskOrm:
         """
@@ -101,6 +240,8 @@ class TaskRepository(BaseRepository):
                 await session.flush()
                 await session.commit()
                 await session.refresh(task)
+
+                self._invalidate_cached(user_id)
                 return task
 
             except SQLAlchemyError as e:
@@ -129,4 +270,6 @@ class TaskRepository(BaseRepository):
             )
 
             await session.commit()
+
+            self._invalidate_cached(user_id)
             return id
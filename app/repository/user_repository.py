@@ -5,14 +5,53 @@ This module contains the UserRepository class which handles all database
 operations related to users, including CRUD operations and user statistics.
 """
 
-from typing import Tuple
+import logging
+from typing import ClassVar, Dict, Sequence, Tuple
 from datetime import datetime
-from sqlalchemy import and_, delete, func, select
-from app.core.database import TaskOrm, UserOrm
+from pydantic import BaseModel, ConfigDict, ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.cache import redis_client, tasks_generation, tasks_statistic_cache
+from app.core.database import TaskOrm, UserOrm, new_session
 from app.dto.auth_dto import AuthDto
 from app.dto.user_dto import UpdateUserDto
 from app.repository.base_repository import BaseRepository
 
+# Setup logging
+logger = logging.getLogger(__name__)
+
+
+class CachedUser(BaseModel):
+    """
+    Snapshot of a user row stored in the Redis cache.
+
+    Mirrors the UserOrm columns so a cached entry can be turned back
+    into a detached ORM object.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    created_at: datetime
+    updated_at: datetime
+    email: str
+    password: str
+    name: str | None = None
+    work_interval: int | None = None
+    break_interval: int | None = None
+    interval_count: int | None = None
+
+    def to_orm(self) -> UserOrm:
+        """
+        Convert the snapshot to a detached UserOrm instance.
+
+        Returns:
+            User object not attached to any session
+        """
+        return UserOrm(**self.model_dump())
+
 
 class UserRepository(BaseRepository):
     """
@@ -20,8 +59,118 @@ class UserRepository(BaseRepository):
 
     This class provides methods for creating, reading, updating, and deleting
     users, as well as retrieving user statistics and task information.
+
+    Users looked up by email or ID are cached in Redis so that every
+    worker can skip the database on repeated lookups. Cache failures
+    never break a request; the database is used instead.
+
+    Invalidation replaces entries with short-lived empty tombstones and
+    entries are only written with SET NX, so a lookup that read the row
+    before an update or delete committed cannot cache its stale copy.
+
+    Attributes:
+        CACHE_VERSION: Key prefix, bump it when CachedUser changes shape
+        CACHE_TTL: Lifetime of cached users in seconds
+        CACHE_TOMBSTONE_TTL: Lifetime of invalidation tombstones in seconds,
+            longer than any user lookup takes
     """
 
+    CACHE_VERSION: ClassVar[str] = "v1"
+    CACHE_TTL: ClassVar[int] = 60
+    CACHE_TOMBSTONE_TTL: ClassVar[int] = 10
+
+    def __init__(
+        self,
+        session: async_sessionmaker[AsyncSession] = new_session,
+        redis: Redis = redis_client,
+    ) -> None:
+        """
+        Initialize the repository with a database session and cache client.
+
+        Args:
+            session: Async session maker for database operations
+            redis: Redis client for the user cache
+        """
+        super().__init__(session)
+        self.redis = redis
+
+    def _email_key(self, email: str) -> str:
+        """Create Redis key for a user looked up by email."""
+        return f"{self.CACHE_VERSION}:user_by_email:{email}"
+
+    def _id_key(self, id: str) -> str:
+        """Create Redis key for a user looked up by ID."""
+        return f"{self.CACHE_VERSION}:user_by_id:{id}"
+
+    async def _get_cached(self, key: str) -> UserOrm | None:
+        """
+        Get a user from the cache.
+
+        Args:
+            key: Redis key of the cached user
+
+        Returns:
+            Detached user object if cached, None on a miss or tombstone
+        """
+        try:
+            cached = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Failed to read user cache: {e}")
+            return None
+
+        if not cached:
+            return None
+
+        try:
+            return CachedUser.model_validate_json(cached).to_orm()
+        except ValidationError as e:
+            # Malformed or written by an older CachedUser, drop it
+            logger.warning(f"Discarding invalid user cache entry: {e}")
+            try:
+                await self.redis.delete(key)
+            except RedisError as e:
+                logger.warning(f"Failed to delete user cache entry: {e}")
+            return None
+
+    async def _set_cached(self, user: UserOrm) -> None:
+        """
+        Store a user in the cache under both its email and ID keys.
+
+        Keys holding a tombstone are left alone, the user may have
+        changed after it was read.
+
+        Args:
+            user: User object to cache
+        """
+        payload = CachedUser.model_validate(user).model_dump_json()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in (self._email_key(user.email), self._id_key(user.id)):
+                    pipe.set(key, payload, ex=self.CACHE_TTL, nx=True)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to write user cache: {e}")
+
+    async def _invalidate_cached(self, id: str, *emails: str) -> None:
+        """
+        Remove a user from the cache.
+
+        Entries are overwritten with empty tombstones rather than deleted,
+        so lookups still running with the old row cannot store it again.
+
+        Args:
+            id: User's unique identifier
+            emails: Email addresses the user may be cached under
+        """
+        keys = [self._id_key(id), *(self._email_key(email) for email in emails)]
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(key, "", ex=self.CACHE_TOMBSTONE_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to invalidate user cache: {e}")
+
     async def create(self, data: AuthDto) -> UserOrm:
         """
         Create a new user in the database.
@@ -36,11 +185,10 @@ class UserRepository(BaseRepository):
             ValueError: If user with the same email already exists
         """
         async with self.session() as session:
-            user = UserOrm(**data.model_dump())
-            session.add(user)
-            await session.flush()
+            query = insert(UserOrm).values(**data.model_dump()).returning(UserOrm)
+            result = await session.execute(query)
+            user = result.scalar_one()
             await session.commit()
-            await session.refresh(user)
             return user
 
     async def find_by_email(self, email: str) -> UserOrm | None:
@@ -53,11 +201,18 @@ class UserRepository(BaseRepository):
         Returns:
             User object if found, None otherwise
         """
+        cached_user = await self._get_cached(self._email_key(email))
+        if cached_user:
+            return cached_user
+
         async with self.session() as session:
             query = select(UserOrm).where(UserOrm.email == email)
             result = await session.execute(query)
             user = result.scalars().first()
-            return user
+
+        if user:
+            await self._set_cached(user)
+        return user
 
     async def find_by_id(self, id: str) -> UserOrm | None:
         """
@@ -69,11 +224,18 @@ class UserRepository(BaseRepository):
         Returns:
             User object if found, None otherwise
         """
+        cached_user = await self._get_cached(self._id_key(id))
+        if cached_user:
+            return cached_user
+
         async with self.session() as session:
             query = select(UserOrm).where(UserOrm.id == id)
             result = await session.execute(query)
             user = result.scalars().first()
-            return user
+
+        if user:
+            await self._set_cached(user)
+        return user
 
     async def get_tasks_statistic(
         self, id: str, today_start: datetime, week_start: datetime
@@ -81,6 +243,11 @@ class UserRepository(BaseRepository):
         """
         Get task statistics for a user.
 
+        Results are cached for a few seconds so that repeated profile
+        polls skip the database. The cache is dropped on task changes
+        and whenever the day changes, and is not filled when the user's
+        tasks changed during the query.
+
         Args:
             id: User's unique identifier
             today_start: Datetime for the start of today
@@ -89,42 +256,50 @@ class UserRepository(BaseRepository):
         Returns:
             Tuple containing (total_tasks, completed_tasks, today_tasks, week_tasks)
         """
-        async with self.session() as session:
-            total_tasks = (
-                await session.scalar(
-                    select(func.count(TaskOrm.id)).where(TaskOrm.user_id == id)
-                )
-                or 0
-            )
+        cached = tasks_statistic_cache.get(id)
+        if cached and cached[0] == today_start:
+            return cached[1]
+
+        generation = tasks_generation.get(id, 0)
+        statistics = await self.get_tasks_statistics([id], today_start, week_start)
+        if tasks_generation.get(id, 0) == generation:
+            tasks_statistic_cache[id] = (today_start, statistics[id])
+        return statistics[id]
+
+    async def get_tasks_statistics(
+        self, ids: Sequence[str], today_start: datetime, week_start: datetime
+    ) -> Dict[str, Tuple[int, int, int, int]]:
+        """
+        Get task statistics for several users with a single grouped query.
 
-            completed_tasks = (
-                await session.scalar(
-                    select(func.count(TaskOrm.id)).where(
-                        and_(TaskOrm.user_id == id, TaskOrm.is_completed.isnot(None))
-                    )
-                )
-                or 0
-            )
+        Args:
+            ids: Unique identifiers of the users
+            today_start: Datetime for the start of today
+            week_start: Datetime for the start of the week
 
-            today_tasks = (
-                await session.scalar(
-                    select(func.count(TaskOrm.id)).where(
-                        and_(TaskOrm.user_id == id, TaskOrm.created_at >= today_start)
-                    )
-                )
-                or 0
+        Returns:
+            Mapping of user ID to a tuple containing
+            (total_tasks, completed_tasks, today_tasks, week_tasks)
+        """
+        task_count = func.count(TaskOrm.id)
+        query = (
+            select(
+                TaskOrm.user_id,
+                task_count,
+                task_count.filter(TaskOrm.is_completed.is_(True)),
+                task_count.filter(TaskOrm.created_at >= today_start),
+                task_count.filter(TaskOrm.created_at >= week_start),
             )
+            .where(TaskOrm.user_id.in_(ids))
+            .group_by(TaskOrm.user_id)
+        )
 
-            week_tasks = (
-                await session.scalar(
-                    select(func.count(TaskOrm.id)).where(
-                        and_(TaskOrm.user_id == id, TaskOrm.created_at >= week_start)
-                    )
-                )
-                or 0
-            )
+        async with self.session() as session:
+            result = await session.execute(query)
+            statistics = {user_id: tuple(counts) for user_id, *counts in result}
 
-            return total_tasks, completed_tasks, today_tasks, week_tasks
+        # Users without tasks have no group in the result
+        return {id: statistics.get(id, (0, 0, 0, 0)) for id in ids}
 
     async def update(self, id: str, data: UpdateUserDto) -> UserOrm | None:
         """
@@ -135,38 +310,64 @@ class UserRepository(BaseRepository):
             data: Updated user data
 
         Returns:
-            Updated user object
-
-        Note:
-            This method assumes the user exists. Existence check should be
-            performed in the service layer before calling this method.
+            Updated user object, None if user was not found
         """
+        values = {key: getattr(data, key) for key in data.model_fields_set}
+        if not values:
+            return await self.find_by_id(id)
+
         async with self.session() as session:
-            query = select(UserOrm).where(UserOrm.id == id)
-            result = await session.execute(query)
-            user = result.scalars().first()
+            # The previous email is only needed to drop its cache entry
+            old_email = None
+            if "email" in values:
+                old_email = await session.scalar(
+                    select(UserOrm.email).where(UserOrm.id == id)
+                )
 
-            update_data = data.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(user, key, value)
+            query = (
+                update(UserOrm)
+                .where(UserOrm.id == id)
+                .values(**values)
+                .returning(UserOrm)
+            )
+            result = await session.execute(query)
+            user = result.scalar_one_or_none()
 
-            await session.flush()
             await session.commit()
-            await session.refresh(user)
-            return user
 
-    async def delete(self, id: str) -> None:
+        if not user:
+            return None
+
+        emails = [user.email, old_email] if old_email else [user.email]
+        await self._invalidate_cached(id, *emails)
+        return user
+
+    async def delete(self, id: str) -> str | None:
         """
         Delete a user from the database.
 
         Args:
             id: User's unique identifier
 
+        Returns:
+            ID of the deleted user, None if user was not found
+
         Note:
             This operation is irreversible and will remove all user data.
         """
         async with self.session() as session:
-            query = delete(UserOrm).where(UserOrm.id == id)
-            await session.execute(query)
+            query = (
+                delete(UserOrm)
+                .where(UserOrm.id == id)
+                .returning(UserOrm.id, UserOrm.email)
+            )
+            result = await session.execute(query)
+            deleted = result.one_or_none()
 
             await session.commit()
+
+        if not deleted:
+            return None
+
+        await self._invalidate_cached(deleted.id, deleted.email)
+        return deleted.id
@@ -14,13 +14,13 @@ from app.services.base_service import BaseService
 from app.core.security import (
     decode_token,
     hash_password,
-    create_access_token,
-    create_refresh_token,
+    create_tokens,
     verify_password,
     REFRESH_TOKEN_COOKIE_NAME,
     REFRESH_TOKEN_EXPIRE_MINUTES,
 )
 from app.core.configs import DEBUG
+from app.utils.concurrency import to_thread_fast
 from app.exceptions import UnauthorizedError, ConflictError, NotFoundException
 
 
@@ -38,7 +38,18 @@ class AuthService(BaseService):
     validation.
     """
 
-    def __init__(self, user_repository: UserRepository = UserRepository()):
+    # Refresh token cookie header parts shared by every auth response.
+    # JWTs are base64url encoded, so the value never needs cookie quoting.
+    _REFRESH_MAX_AGE = REFRESH_TOKEN_EXPIRE_MINUTES * 60
+    _COOKIE_PREFIX = f"{REFRESH_TOKEN_COOKIE_NAME}=".encode("latin-1")
+    _COOKIE_SUFFIX = (
+        f"; HttpOnly; Max-Age={_REFRESH_MAX_AGE}; Path=/; SameSite=lax"
+        f"{'; Secure' if not DEBUG else ''}"  # Secure for production
+    ).encode("latin-1")
+
+    __slots__ = ("user_repository",)
+
+    def __init__(self, user_repository: UserRepository):
         """
         Initialize the authentication service.
 
@@ -55,14 +66,13 @@ class AuthService(BaseService):
             response: FastAPI response object
             refresh_token: JWT refresh token to set in cookie
         """
-        response.set_cookie(
-            key=REFRESH_TOKEN_COOKIE_NAME,
-            value=refresh_token,
-            httponly=True,
-            secure=not DEBUG,  # True for production
-            samesite="lax",
-            max_age=REFRESH_TOKEN_EXPIRE_MINUTES * 60,
-            path="/",
+        response.raw_headers.append(
+            (
+                b"set-cookie",
+                self._COOKIE_PREFIX
+                + refresh_token.encode("ascii")
+                + self._COOKIE_SUFFIX,
+            )
         )
 
     def _remove_refresh_token_cookie(self, response: Response):
@@ -101,9 +111,7 @@ class AuthService(BaseService):
                 detail="User not found", resource_type="User", resource_id=user_id
             )
 
-        access_token = create_access_token(user.id)
-        refresh_token = create_refresh_token(user.id)
-        return access_token, refresh_token
+        return create_tokens(user.id)
 
     async def register(self, data: AuthDto, response: Response) -> AuthResponseDto:
         """
@@ -125,12 +133,11 @@ class AuthService(BaseService):
         if existing_user:
             raise ConflictError(detail="Email already registered")
 
-        hashed_password = hash_password(data.password)
+        hashed_password = await to_thread_fast(hash_password, data.password)
         data.password = hashed_password
         user = await self.user_repository.create(data)
 
-        access_token = create_access_token(user.id)
-        refresh_token = create_refresh_token(user.id)
+        access_token, refresh_token = create_tokens(user.id)
 
         self._set_refresh_token_cookie(response, refresh_token)
 
@@ -160,11 +167,10 @@ class AuthService(BaseService):
                 resource_id=data.email,
             )
 
-        if not verify_password(data.password, user.password):
+        if not await to_thread_fast(verify_password, data.password, user.password):
             raise UnauthorizedError(detail="Incorrect password")
 
-        access_token = create_access_token(user.id)
-        refresh_token = create_refresh_token(user.id)
+        access_token, refresh_token = create_tokens(user.id)
 
         self._set_refresh_token_cookie(response, refresh_token)
 
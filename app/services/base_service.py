@@ -9,13 +9,27 @@ The BaseService provides utility methods for converting between different
 data formats and implementing common service layer patterns.
 """
 
+from functools import lru_cache
 from typing import Type, TypeVar, Any, Dict
-from pydantic import BaseModel
-
+from pydantic import BaseModel, TypeAdapter
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _get_adapter(dto_class: Type[T]) -> TypeAdapter[T]:
+    """
+    Get the cached TypeAdapter for a DTO class.
+
+    Args:
+        dto_class: The Pydantic model class to validate
+
+    Returns:
+        TypeAdapter built once per DTO class
+    """
+    return TypeAdapter(dto_class)
+
+
 class BaseService:
     """
     Base service class providing common service operations.
@@ -30,7 +44,10 @@ class BaseService:
     service layer patterns.
     """
 
-    def _to_dto(self, dto_class: Type[T], data: Any) -> T:
+    __slots__ = ()
+
+    @staticmethod
+    def _to_dto(dto_class: Type[T], data: Any) -> T:
         """
         Convert data to a Pydantic DTO (Data Transfer Object).
 
@@ -48,7 +65,7 @@ class BaseService:
         Raises:
             ValidationError: If data doesn't match DTO schema
         """
-        return dto_class.model_validate(data)
+        return _get_adapter(dto_class).validate_python(data, from_attributes=True)
 
     def _to_dict(self, data: Any) -> Dict[str, Any]:
         """
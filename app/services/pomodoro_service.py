@@ -6,12 +6,17 @@ for pomodoro sessions and rounds, including session creation, round management,
 and pomodoro timer functionality.
 """
 
+import logging
+from fastapi import BackgroundTasks
 from app.core.database import PomodoroRoundOrm, PomodoroSessionOrm
 from app.dto.pomodoro_dto import PomodoroRoundDto, PomodoroSessionDto
 from app.repository.base_repository import BaseRepository
 from app.repository.pomodoro_repository import PomodoroRepository
 from app.services.base_service import BaseService
 
+# Setup logging
+logger = logging.getLogger(__name__)
+
 
 class PomodoroService(BaseService):
     """
@@ -23,7 +28,9 @@ class PomodoroService(BaseService):
     and the repository layer.
     """
 
-    def __init__(self, pomodoro_repository: PomodoroRepository = PomodoroRepository()):
+    __slots__ = ("pomodoro_repository",)
+
+    def __init__(self, pomodoro_repository: PomodoroRepository):
         """
         Initialize the pomodoro service.
 
@@ -108,3 +115,42 @@ class PomodoroService(BaseService):
         """
         await self.pomodoro_repository.delete_session(user_id, session_id)
         return session_id
+
+    def schedule_delete_pomodoro_session(
+        self, background_tasks: BackgroundTasks, user_id: str, session_id: str
+    ) -> str:
+        """
+        Schedule a pomodoro session deletion to run after the response is sent.
+
+        Args:
+            background_tasks: FastAPI background tasks of the current request
+            user_id: ID of the user who owns the session
+            session_id: ID of the pomodoro session to delete
+
+        Returns:
+            ID of the session scheduled for deletion
+
+        Note:
+            Failures happen after the response and are only logged.
+            Use delete_pomodoro_session() when the caller must know
+            the session is gone.
+        """
+        background_tasks.add_task(
+            self._delete_pomodoro_session_in_background, user_id, session_id
+        )
+        return session_id
+
+    async def _delete_pomodoro_session_in_background(
+        self, user_id: str, session_id: str
+    ) -> None:
+        """
+        Delete a pomodoro session and log any failure.
+
+        Args:
+            user_id: ID of the user who owns the session
+            session_id: ID of the pomodoro session to delete
+        """
+        try:
+            await self.pomodoro_repository.delete_session(user_id, session_id)
+        except Exception as e:
+            logger.error(f"Failed to delete pomodoro session {session_id}: {e}")
@@ -7,12 +7,21 @@ deletion. It acts as an intermediary between the API layer and the
 repository layer for task-related operations.
 """
 
-from typing import List
+import logging
+from typing import AsyncIterator, List
+from fastapi import BackgroundTasks
+from pydantic import TypeAdapter
 from app.core.database import TaskOrm
-from app.dto.task_dto import CreateTaskDto, TaskDto, UpdateTaskDto
+from app.dto.task_dto import CreateTaskDto, TaskDto, TaskStruct, UpdateTaskDto
 from app.repository.task_repository import TaskRepository
 from app.services.base_service import BaseService
 
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Validator for task DTOs, built once per process
+_TASK_ADAPTER = TypeAdapter(TaskDto)
+
 
 class TaskService(BaseService):
     """
@@ -28,7 +37,9 @@ class TaskService(BaseService):
     business rule enforcement.
     """
 
-    def __init__(self, task_repository: TaskRepository = TaskRepository()):
+    __slots__ = ("task_repository",)
+
+    def __init__(self, task_repository: TaskRepository):
         """
         Initialize the task service.
 
@@ -37,7 +48,8 @@ class TaskService(BaseService):
         """
         self.task_repository = task_repository
 
-    def _to_dto(self, task: TaskOrm) -> TaskDto:
+    @staticmethod
+    def _to_dto(task: TaskOrm) -> TaskDto:
         """
         Convert TaskOrm to TaskDto.
 
@@ -47,7 +59,7 @@ class TaskService(BaseService):
         Returns:
             Task DTO instance
         """
-        return TaskDto.model_validate(task)
+        return _TASK_ADAPTER.validate_python(task, from_attributes=True)
 
     async def create(self, user_id: str, dto: CreateTaskDto) -> TaskDto:
         """
@@ -67,7 +79,23 @@ class TaskService(BaseService):
         task = await self.task_repository.create(user_id, dto)
         return self._to_dto(task)
 
-    async def get_all(self, user_id: str) -> List[TaskDto]:
+    async def create_many(self, user_id: str, dtos: List[CreateTaskDto]) -> List[str]:
+        """
+        Create several tasks for a user at once.
+
+        Args:
+            user_id: ID of the user who owns the tasks
+            dtos: Task creation data for every task
+
+        Returns:
+            IDs of the created tasks, in input order
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        return await self.task_repository.create_many(user_id, dtos)
+
+    async def get_all(self, user_id: str) -> List[TaskStruct]:
         """
         Get all tasks for a specific user.
 
@@ -75,15 +103,40 @@ class TaskService(BaseService):
             user_id: ID of the user whose tasks to retrieve
 
         Returns:
-            List of task DTOs belonging to the user
+            List of task structs belonging to the user, ready for
+            msgspec encoding
 
         Note:
             Returns empty list if user has no tasks or if database
             operation fails.
         """
-        tasks = await self.task_repository.get_all(user_id)
-        tasks = [self._to_dto(task) for task in tasks]
-        return tasks
+        return await self.task_repository.get_all(user_id)
+
+    async def get_all_json(self, user_id: str) -> bytes:
+        """
+        Get all tasks for a specific user as an encoded JSON array.
+
+        Args:
+            user_id: ID of the user whose tasks to retrieve
+
+        Returns:
+            JSON array of the user's tasks, possibly cached for a
+            few seconds
+        """
+        return await self.task_repository.get_all_json(user_id)
+
+    def iter_all(self, user_id: str) -> AsyncIterator[TaskStruct]:
+        """
+        Stream all tasks for a specific user.
+
+        Args:
+            user_id: ID of the user whose tasks to retrieve
+
+        Returns:
+            Async iterator of task structs, fetched from the
+            database in batches as it is consumed
+        """
+        return self.task_repository.iter_all(user_id)
 
     async def update(self, user_id: str, id: str, task: UpdateTaskDto) -> TaskDto:
         """
@@ -122,3 +175,37 @@ class TaskService(BaseService):
         """
         await self.task_repository.delete(user_id, id)
         return id
+
+    def schedule_delete(
+        self, background_tasks: BackgroundTasks, user_id: str, id: str
+    ) -> str:
+        """
+        Schedule a task deletion to run after the response is sent.
+
+        Args:
+            background_tasks: FastAPI background tasks of the current request
+            user_id: ID of the user who owns the task
+            id: Task's unique identifier
+
+        Returns:
+            ID of the task scheduled for deletion
+
+        Note:
+            Failures happen after the response and are only logged.
+            Use delete() when the caller must know the task is gone.
+        """
+        background_tasks.add_task(self._delete_in_background, user_id, id)
+        return id
+
+    async def _delete_in_background(self, user_id: str, id: str) -> None:
+        """
+        Delete a task and log any failure.
+
+        Args:
+            user_id: ID of the user who owns the task
+            id: Task's unique identifier
+        """
+        try:
+            await self.task_repository.delete(user_id, id)
+        except Exception as e:
+            logger.error(f"Failed to delete task {id}: {e}")
@@ -7,6 +7,8 @@ deletion, and user statistics. It acts as an intermediary between
 the API layer and the repository layer for user-related operations.
 """
 
+import asyncio
+from pydantic import TypeAdapter
 from sqlalchemy import and_, func, select
 from app.core.database import TaskOrm, UserOrm
 from app.dto.auth_dto import AuthDto
@@ -15,6 +17,12 @@ from app.repository.user_repository import UserRepository
 from app.utils.date import get_start_datetime
 from app.exceptions import NotFoundException
 
+# Validator for user DTOs, built once per process
+_USER_ADAPTER = TypeAdapter(UserDto)
+
+# UserDto fields copied from the ORM row when building profile responses
+_USER_FIELDS = tuple(UserDto.model_fields)
+
 
 class UserService:
     """
@@ -30,7 +38,9 @@ class UserService:
     business rule enforcement for user management.
     """
 
-    def __init__(self, user_repository: UserRepository = UserRepository()):
+    __slots__ = ("user_repository",)
+
+    def __init__(self, user_repository: UserRepository):
         """
         Initialize the user service.
 
@@ -39,7 +49,8 @@ class UserService:
         """
         self.user_repository = user_repository
 
-    def _to_dto(self, user: UserOrm) -> UserDto:
+    @staticmethod
+    def _to_dto(user: UserOrm) -> UserDto:
         """
         Convert UserOrm to UserDto.
 
@@ -49,7 +60,7 @@ class UserService:
         Returns:
             User DTO instance
         """
-        return UserDto.model_validate(user)
+        return _USER_ADAPTER.validate_python(user, from_attributes=True)
 
     async def create(self, dto: AuthDto) -> UserDto:
         """
@@ -85,7 +96,13 @@ class UserService:
         Raises:
             NotFoundException: If user with specified ID is not found
         """
-        user = await self.user_repository.find_by_id(id)
+        today_start, week_start = get_start_datetime()
+        user, (total_tasks, completed_tasks, today_tasks, week_tasks) = (
+            await asyncio.gather(
+                self.user_repository.find_by_id(id),
+                self.user_repository.get_tasks_statistic(id, today_start, week_start),
+            )
+        )
         if not user:
             raise NotFoundException(
                 detail="User with this id not found",
@@ -93,13 +110,9 @@ class UserService:
                 resource_id=id,
             )
 
-        today_start, week_start = get_start_datetime()
-        total_tasks, completed_tasks, today_tasks, week_tasks = (
-            await self.user_repository.get_tasks_statistic(id, today_start, week_start)
-        )
-
-        return GetUserDto(
-            **UserDto.model_validate(user).model_dump(),
+        # Row and counters come from the database, so validation is skipped
+        return GetUserDto.model_construct(
+            **{field: getattr(user, field) for field in _USER_FIELDS},
             total_tasks=total_tasks,
             completed_tasks=completed_tasks,
             today_tasks=today_tasks,
@@ -166,15 +179,6 @@ class UserService:
             ValidationError: If user data is invalid
             SQLAlchemyError: If database operation fails
         """
-        # Check if user exists before updating
-        # existing_user = await self.user_repository.find_by_id(id)
-        # if not existing_user:
-        #     raise NotFoundException(
-        #         detail="User with this id not found",
-        #         resource_type="User",
-        #         resource_id=id,
-        #     )
-
         user = await self.user_repository.update(id, dto)
         if not user:
             raise NotFoundException(
@@ -194,10 +198,18 @@ class UserService:
         Returns:
             ID of the deleted user
 
+        Raises:
+            NotFoundException: If user with specified ID is not found
+
         Note:
             This operation is irreversible and will permanently remove
             the user and all associated data (tasks, pomodoro sessions, etc.).
-            No exception is raised if user doesn't exist.
         """
-        await self.user_repository.delete(id)
-        return id
+        deleted_id = await self.user_repository.delete(id)
+        if not deleted_id:
+            raise NotFoundException(
+                detail="User with this id not found",
+                resource_type="User",
+                resource_id=id,
+            )
+        return deleted_id
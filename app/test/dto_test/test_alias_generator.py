@@ -1,6 +1,6 @@
 import unittest
 
-from dto.base_dto import alias_generator
+from app.dto.base_dto import alias_generator
 
 
 class TestAliasGenerator(unittest.TestCase):
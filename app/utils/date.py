@@ -6,9 +6,31 @@ including getting start/end times for different periods and date
 formatting utilities.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from functools import lru_cache
 from typing import Tuple, Optional
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Bound once, get_start_datetime runs on every profile request
+_now = datetime.now
+_WEEK = timedelta(days=7)
+
+
+@lru_cache(maxsize=8)
+def _tz(timezone: str) -> ZoneInfo:
+    """
+    Get timezone by name, falling back to UTC if it is invalid.
+
+    Args:
+        timezone: Timezone string
+
+    Returns:
+        Cached timezone object
+    """
+    try:
+        return ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
 
 
 def get_start_datetime(timezone: str = "UTC") -> Tuple[datetime, datetime]:
@@ -26,24 +48,12 @@ def get_start_datetime(timezone: str = "UTC") -> Tuple[datetime, datetime]:
         >>> print(today)  # 2024-01-15 00:00:00
         >>> print(week_ago)  # 2024-01-08 00:00:00
     """
-    try:
-        tz = pytz.timezone(timezone)
-        now = datetime.now(tz)
+    now = _now(_tz(timezone))
 
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = (now - timedelta(days=7)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+    today_start = datetime.combine(now.date(), time.min, tzinfo=now.tzinfo)
+    week_start = datetime.combine((now - _WEEK).date(), time.min, tzinfo=now.tzinfo)
 
-        return today_start, week_start
-    except pytz.exceptions.UnknownTimeZoneError:
-        # Fallback to UTC if timezone is invalid
-        now = datetime.now(pytz.timezone("UTC"))
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = (now - timedelta(days=7)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        return today_start, week_start
+    return today_start, week_start
 
 
 def get_month_start_datetime(timezone: str = "UTC") -> datetime:
@@ -60,13 +70,8 @@ def get_month_start_datetime(timezone: str = "UTC") -> datetime:
         >>> month_start = get_month_start_datetime()
         >>> print(month_start)  # 2024-01-01 00:00:00
     """
-    try:
-        tz = pytz.timezone(timezone)
-        now = datetime.now(tz)
-        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    except pytz.exceptions.UnknownTimeZoneError:
-        now = datetime.now(pytz.timezone("UTC"))
-        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    now = datetime.now(_tz(timezone))
+    return datetime.combine(now.date().replace(day=1), time.min, tzinfo=now.tzinfo)
 
 
 def get_date_range(days: int, timezone: str = "UTC") -> Tuple[datetime, datetime]:
@@ -85,23 +90,12 @@ def get_date_range(days: int, timezone: str = "UTC") -> Tuple[datetime, datetime
         >>> print(start)  # 2023-12-16 00:00:00
         >>> print(end)    # 2024-01-15 23:59:59
     """
+    now = datetime.now(_tz(timezone))
 
-    try:
-        tz = pytz.timezone(timezone)
-        now = datetime.now(tz)
-
-        end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        start_date = (now - timedelta(days=days)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-
-        return start_date, end_date
-    except pytz.exceptions.UnknownTimeZoneError:
-        now = datetime.now(pytz.timezone("UTC"))
-        end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        start_date = (now - timedelta(days=days)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+    end_date = datetime.combine(now.date(), time.max, tzinfo=now.tzinfo)
+    start_date = datetime.combine(
+        (now - timedelta(days=days)).date(), time.min, tzinfo=now.tzinfo
+    )
 
     return start_date, end_date
 
@@ -1,37 +1,42 @@
 """
-Test script to verify alias_generator functionality.
+Tests for alias_generator behaviour on DTOs.
 """
 
 from app.dto.user_dto import UpdateUserDto
 
+# Test data with camelCase field names
+TEST_DATA = {
+    "email": "test@example.com",
+    "workInterval": 25,  # camelCase
+    "breakInterval": 5,  # camelCase
+    "intervalCount": 4,  # camelCase
+}
+
 
 def test_alias_generator():
     """Test that camelCase field names are properly converted."""
+    dto = UpdateUserDto(**TEST_DATA)
 
-    # Test data with camelCase field names
-    test_data = {
+    assert dto.work_interval == 25
+    assert dto.break_interval == 5
+    assert dto.interval_count == 4
+    assert dto.model_dump(by_alias=True) == {
         "email": "test@example.com",
-        "workInterval": 25,  # camelCase
-        "breakInterval": 5,  # camelCase
-        "intervalCount": 4,  # camelCase
+        "password": None,
+        "name": None,
+        "workInterval": 25,
+        "breakInterval": 5,
+        "intervalCount": 4,
     }
 
-    try:
-        # Create UpdateUserDto from camelCase data
-        dto = UpdateUserDto(**test_data)
-        print("✅ Successfully created DTO from camelCase data")
-        print(f"DTO fields: {dto.model_dump()}")
-
-        # Test conversion back to camelCase
-        camel_case_data = dto.model_dump(by_alias=True)
-        print(f"✅ CamelCase output: {camel_case_data}")
-
-        return True
 
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
+def test_validate_benchmark(benchmark):
+    """Measure UpdateUserDto construction with validation."""
+    dto = benchmark(UpdateUserDto, **TEST_DATA)
+    assert dto.interval_count == 4
 
 
-if __name__ == "__main__":
-    test_alias_generator()
+def test_construct_benchmark(benchmark):
+    """Measure UpdateUserDto construction without validation."""
+    dto = benchmark(UpdateUserDto.model_construct, **TEST_DATA)
+    assert dto.interval_count == 4